@@ -32,12 +32,12 @@ class api_login:
                                f'headers: {header_dump}; wsgi: {wsgi_dump}')
                 return make_api_response("", "Unauthorized access denied", 401)
 
-            client_info = dict(
-                client_id=request.headers['container_id'],
-                service_name=request.headers['service_name'],
-                service_version=request.headers['service_version'],
-                service_tool_version=request.headers.get('service_tool_version'),
-            )
+            client_info = {
+                'client_id': request.headers['container_id'],
+                'service_name': request.headers['service_name'],
+                'service_version': request.headers['service_version'],
+                'service_tool_version': request.headers.get('service_tool_version'),
+            }
 
             if config.core.metrics.apm_server.server_url is not None:
                 elasticapm.set_user_context(username=client_info['service_name'])
@@ -93,9 +93,9 @@ def upload_file(client_info):
             TASKING_CLIENT.upload_file(temp_file.name, classification, ttl, is_section_image, expected_sha256=sha256)
         except TaskingClientException as e:
             LOGGER.warning(f"{client_info['client_id']} - {client_info['service_name']}: {str(e)}")
-            return make_api_response(dict(success=False), err=str(e), status_code=400)
+            return make_api_response({'success': False}, err=str(e), status_code=400)
 
     LOGGER.info(f"{client_info['client_id']} - {client_info['service_name']}: "
                 f"Successfully uploaded file (SHA256: {sha256})")
 
-    return make_api_response(dict(success=True))
+    return make_api_response({'success': True})
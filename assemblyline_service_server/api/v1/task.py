@@ -5,7 +5,7 @@ from werkzeug.exceptions import BadRequest
 
 from assemblyline_core.tasking_client import ServiceMissingException
 from assemblyline_service_server.api.base import api_login, make_subapi_blueprint
-from assemblyline_service_server.config import TASKING_CLIENT
+from assemblyline_service_server.config import MAX_RESULT_BODY_SIZE, TASKING_CLIENT
 from assemblyline_service_server.helper.response import make_api_response
 from assemblyline_service_server.helper.metrics import get_metrics_factory
 
@@ -14,6 +14,9 @@ SUB_API = 'task'
 task_api = make_subapi_blueprint(SUB_API, api_version=1)
 task_api._doc = "Perform operations on service tasks"
 
+# Timeouts most services poll with, so we can skip the string conversion
+TIMEOUT_CACHE = {'30': 30, '60': 60, '120': 120}
+
 
 @task_api.route("/", methods=["GET"])
 @api_login()
@@ -33,7 +36,8 @@ def get_task(client_info):
     service_version = client_info['service_version']
     service_tool_version = client_info['service_tool_version']
     client_id = client_info['client_id']
-    remaining_time = timeout = int(float(request.headers.get('timeout', 30)))
+    raw_timeout = request.headers.get('timeout', '30')
+    remaining_time = timeout = TIMEOUT_CACHE.get(raw_timeout) or int(float(raw_timeout))
     metric_factory = get_metrics_factory(service_name)
 
     start_time = time.time()
@@ -48,15 +52,15 @@ def get_task(client_info):
             return make_api_response({}, str(e), 404)
 
         if task is not None:
-            return make_api_response(dict(task=task))
+            return make_api_response({'task': task})
         elif not retry:
-            return make_api_response(dict(task=False))
+            return make_api_response({'task': False})
 
         # Recalculating how much time we have left before we reach the timeout
         remaining_time = start_time + timeout - time.time()
 
     # We've been processing cache hit for the length of the timeout... bailing out!
-    return make_api_response(dict(task=False))
+    return make_api_response({'task': False})
 
 
 @task_api.route("/", methods=["POST"])
@@ -79,9 +83,16 @@ def task_finished(client_info):
      "freshen": true
     }
     """
+    # Refuse oversized bodies before reading and parsing them
+    if MAX_RESULT_BODY_SIZE is not None and (request.content_length or 0) > MAX_RESULT_BODY_SIZE:
+        return make_api_response("", "Data received is larger than the maximum allowed size", 413)
+
     try:
+        # Nothing reads the body again, don't cache it so the raw bytes can be freed as soon as they are parsed
+        data = request.get_json(cache=False)
+
         service_name = client_info['service_name']
-        response = TASKING_CLIENT.task_finished(request.json, client_info['client_id'],
+        response = TASKING_CLIENT.task_finished(data, client_info['client_id'],
                                                 service_name, get_metrics_factory(service_name))
         if response:
             return make_api_response(response)
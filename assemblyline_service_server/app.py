@@ -10,6 +10,7 @@ from assemblyline_service_server.api.v1.file import file_api
 from assemblyline_service_server.api.v1.service import service_api
 from assemblyline_service_server.api.v1.task import task_api
 from assemblyline_service_server.api.v1.safelist import safelist_api
+from assemblyline_service_server.helper.json_provider import OrJSONProvider
 from assemblyline_service_server.healthz import healthz
 
 config = forge.get_config()
@@ -31,6 +32,7 @@ if all([path.exists(fp) for fp in CERT_BUNDLE]):
 # Prepare the app
 app = Flask('svc-server')
 app.config['SECRET_KEY'] = config.ui.secret_key
+app.json = OrJSONProvider(app)
 
 app.register_blueprint(healthz)
 app.register_blueprint(file_api)
@@ -2,6 +2,8 @@ import logging
 import os
 import threading
 
+from werkzeug.local import LocalProxy
+
 from assemblyline.common import forge
 from assemblyline.common import log as al_log
 from assemblyline.common.version import BUILD_MINOR, FRAMEWORK_VERSION, SYSTEM_VERSION
@@ -33,6 +35,7 @@ CLASSIFICATION = forge.get_classification()
 DEBUG = config.ui.debug
 VERSION = os.environ.get('ASSEMBLYLINE_VERSION', f"{FRAMEWORK_VERSION}.{SYSTEM_VERSION}.{BUILD_MINOR}.dev0")
 AUTH_KEY = os.environ.get('SERVICE_API_KEY', 'ThisIsARandomAuthKey...ChangeMe!')
+MAX_RESULT_BODY_SIZE = int(os.environ['MAX_RESULT_BODY_SIZE']) if os.environ.get('MAX_RESULT_BODY_SIZE') else None
 
 RATE_LIMITER = Counters(prefix="quota", host=redis, track_counters=True)
 
@@ -57,7 +60,35 @@ LOGGER.debug('Logger ready!')
 STORAGE = forge.get_datastore(config=config)
 FILESTORE = forge.get_filestore(config=config)
 LOCK = threading.Lock()
-TASKING_CLIENT = TaskingClient(datastore=STORAGE, filestore=FILESTORE, redis=redis, redis_persist=redis_persist)
-SAFELIST_CLIENT = SafelistClient(datastore=STORAGE)
+
+# The clients are only created on first use so freshly recycled workers can start answering right away
+#  - They have their own lock so a slow first connection doesn't hold up metrics factory creation
+_CLIENTS = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def _get_client(name, builder):
+    client = _CLIENTS.get(name, None)
+
+    if client is None:
+        with _CLIENTS_LOCK:
+            client = _CLIENTS.get(name, None)
+            if client is None:
+                client = builder()
+                _CLIENTS[name] = client
+
+    return client
+
+
+def _build_tasking_client():
+    return TaskingClient(datastore=STORAGE, filestore=FILESTORE, redis=redis, redis_persist=redis_persist)
+
+
+def _build_safelist_client():
+    return SafelistClient(datastore=STORAGE)
+
+
+TASKING_CLIENT = LocalProxy(lambda: _get_client('tasking', _build_tasking_client))
+SAFELIST_CLIENT = LocalProxy(lambda: _get_client('safelist', _build_safelist_client))
 # End global
 #################################################################
@@ -7,7 +7,14 @@ bind = f":{int(env.get('PORT', 5003))}"
 # Number of processes to launch
 workers = int(env.get('WORKERS', multiprocessing.cpu_count()))
 
+# Worker type, the task endpoints are I/O bound so default to gevent
+#  - WORKER_CLASS and the app entrypoint must be changed together: gevent requires the app to be loaded from
+#    assemblyline_service_server.patched, and any other worker type (sync, gthread) must load
+#    assemblyline_service_server.app:app instead since the patched entrypoint monkey patches the whole process
+worker_class = env.get('WORKER_CLASS', 'gevent')
+
 # Number of concurrent handled connections
+#  - threads only applies to the gthread worker, worker_connections only to async workers like gevent
 threads = int(env.get('THREADS', 4))
 worker_connections = int(env.get('WORKER_CONNECTIONS', '1000'))
 
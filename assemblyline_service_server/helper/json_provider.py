@@ -0,0 +1,29 @@
+import orjson
+
+from flask.json.provider import JSONProvider
+
+
+def _default(o):
+    # Objects exposing __html__ are the only extra type handled, anything else orjson can't serialize raises
+    if hasattr(o, "__html__"):
+        return str(o.__html__())
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+class OrJSONProvider(JSONProvider):
+    """JSON provider that parses request bodies and serializes responses with orjson.
+
+    Keys are not sorted and the output is never pretty-printed, which keeps large result payloads cheap.
+
+    Differences with flask's default provider:
+     - datetime objects are serialized as ISO 8601 strings instead of HTTP dates
+     - Decimal objects are not serializable
+     - Integers larger than 64 bits are parsed as floats
+     - NaN and Infinity are rejected when parsing
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
@@ -10,7 +10,10 @@ def get_metrics_factory(service_name):
 
     if factory is None:
         with LOCK:
-            factory = MetricsFactory('service', Metrics, name=service_name, export_zero=False)
-            METRICS_FACTORIES[service_name] = factory
+            # Another thread may have created the factory while we were waiting on the lock
+            factory = METRICS_FACTORIES.get(service_name, None)
+            if factory is None:
+                factory = MetricsFactory('service', Metrics, name=service_name, export_zero=False)
+                METRICS_FACTORIES[service_name] = factory
 
     return factory
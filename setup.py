@@ -39,11 +39,12 @@ setup(
         'assemblyline',
         'assemblyline-core',
         'werkzeug',
-        'flask',
+        'flask>=2.2',
         'flask-socketio',
         'gunicorn',
         'gevent',
         'gevent-websocket',
+        'orjson',
     ],
     extras_require={
         'test': [
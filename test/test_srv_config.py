@@ -0,0 +1,26 @@
+from unittest.mock import patch, MagicMock
+
+from werkzeug.local import LocalProxy
+
+from assemblyline_service_server import config
+
+
+def test_client_built_once():
+    builder = MagicMock()
+    proxy = LocalProxy(lambda: config._get_client('test_client', builder))
+    try:
+        proxy.ping()
+        proxy.ping()
+        assert builder.call_count == 1
+        assert builder.return_value.ping.call_count == 2
+    finally:
+        config._CLIENTS.pop('test_client', None)
+
+
+def test_patch_through_client_proxy():
+    ds = MagicMock()
+    original = config.TASKING_CLIENT.datastore
+    with patch('assemblyline_service_server.config.TASKING_CLIENT.datastore', ds):
+        assert config.TASKING_CLIENT.datastore is ds
+        assert config._CLIENTS['tasking'].datastore is ds
+    assert config.TASKING_CLIENT.datastore is original
@@ -1,3 +1,4 @@
+import json
 from unittest.mock import patch, MagicMock
 
 import pytest
@@ -178,3 +179,42 @@ def test_finish_missing_file(client, dispatch_client, heuristics):
     assert resp.status_code == 200
     assert resp.json['api_response']['success'] is False
     assert set(resp.json['api_response']['missing_files']) == missing
+
+
+def test_finish_invalid_json(client, dispatch_client):
+    resp = client.post('/api/v1/task/', headers=headers, data=b'{"task": ', content_type='application/json')
+    assert resp.status_code == 400
+    assert dispatch_client.service_finished.call_count == 0
+    assert dispatch_client.service_failed.call_count == 0
+
+
+def test_finish_non_finite_json(client, dispatch_client):
+    # The stdlib parser accepts NaN, orjson rejects it before it reaches the tasking client
+    task = random_minimal_obj(Task)
+    result = random_minimal_obj(Result)
+    message = {'task': task.as_primitives(), 'result': result.as_primitives(), 'freshen': float('nan')}
+    resp = client.post('/api/v1/task/', headers=headers, data=json.dumps(message), content_type='application/json')
+    assert resp.status_code == 400
+    assert dispatch_client.service_finished.call_count == 0
+
+
+def test_response_keys_not_sorted(client, dispatch_client):
+    dispatch_client.request_work.return_value = None
+    resp = client.get('/api/v1/task/', headers=headers)
+    assert resp.status_code == 200
+    assert b'": ' not in resp.data
+    assert list(json.loads(resp.data)) == ['api_response', 'api_error_message', 'api_server_version',
+                                           'api_status_code']
+
+
+def test_finish_too_large(client, dispatch_client):
+    task = random_minimal_obj(Task)
+    result = random_minimal_obj(Result)
+    message = {'task': task.as_primitives(), 'result': result.as_primitives(), 'freshen': False}
+    with patch('assemblyline_service_server.api.v1.task.MAX_RESULT_BODY_SIZE', 10):
+        resp = client.post('/api/v1/task/', headers=headers, json=message)
+    assert resp.status_code == 413
+    assert resp.json['api_status_code'] == 413
+    assert resp.json['api_response'] == ""
+    assert dispatch_client.service_finished.call_count == 0
+    assert dispatch_client.service_failed.call_count == 0